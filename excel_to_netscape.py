@@ -14,50 +14,133 @@ Description:
          save location for the generated HTML file.
       5. Initializes a 'ProgressLoader' to provide visual feedback via a popup
          window and simultaneous terminal output.
-      6. Reads the Excel file and validates the presence of required columns
-         ('Title', 'URL').
+      6. Scans the Excel header row and validates the presence of required
+         columns ('Title', 'URL').
       7. Dynamically detects folder columns (e.g., 'FolderL1', 'FolderL2') using
-         regex to support arbitrary directory depth.
+         regex to support arbitrary directory depth, then reads only those
+         columns as string data.
       8. Cleans the dataset, handling missing values and converting types.
-      9. Transforms the flat Excel data into a nested dictionary tree structure
-         representing the bookmark hierarchy.
-     10. Recursively generates Netscape-compliant HTML tags from the tree.
-     11. Writes the final HTML file to disk and reveals it in the system's
+      9. Groups the rows by folder path (keeping the original Excel order) and
+         streams them into Netscape-compliant HTML tags, compiling statistics
+         (total bookmarks, folders per level) in the same pass.
+     10. Writes the final HTML file to disk and reveals it in the system's
          file manager (Finder, Explorer, etc.).
-     12. Analyzes the generated tree to compile statistics (total bookmarks,
-         folders per level).
-     13. Displays a final summary window detailing the conversion results.
+     11. Displays a final summary window detailing the conversion results.
 
 Usage:
     - Ensure required libraries are installed:
-          pip install pandas openpyxl
+          pip install pandas openpyxl python-calamine
     - Run the script from a terminal:
           python excel_to_netscape.py
+    - Optionally skip pandas and read rows directly with python-calamine:
+          python excel_to_netscape.py --no-pandas
+    - Convert headlessly (no GUI, tkinter is never loaded) for scripts/CI:
+          python excel_to_netscape.py --input bookmarks.xlsx --output bookmarks.html
 
 Author:     Vitalii Starosta
 GitHub:     https://github.com/sztaroszta
 License:    GNU Affero General Public License v3 (AGPLv3)
 """
 
+import argparse
 import collections
-import html
 import os
 import re
 import subprocess
 import sys
 import time
-import tkinter as tk
-from datetime import datetime
-from tkinter import filedialog, messagebox, ttk, _tkinter
+from datetime import date, datetime
 
+import numpy as np
 import pandas as pd
 
+# Optional fast reader: python-calamine (Rust) parses .xlsx far quicker than openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# pandas only accepts engine='calamine' from 2.2 on; older versions keep openpyxl
+PANDAS_VERSION = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+PANDAS_SUPPORTS_CALAMINE = CALAMINE_AVAILABLE and PANDAS_VERSION >= (2, 2)
+
+# Optional Arrow-backed strings: the clean-up below then runs on contiguous buffers
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    STRING_DTYPE = pd.StringDtype('python')
+
 # Configuration Constants
 TITLE_COLUMN = 'Title'
 URL_COLUMN = 'URL'
+FOLDER_COLUMN_PATTERN = re.compile(r'FolderL(\d+)')
+
+# Netscape bookmark file wrapper, pre-encoded for the binary writer
+HTML_HEADER = (
+    "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
+    "<META HTTP-EQUIV=\"Content-Type\" CONTENT=\"text/html; charset=UTF-8\">\n"
+    "<TITLE>Bookmarks</TITLE>\n"
+    "<H1>Bookmarks</H1>\n"
+    "<DL><p>\n"
+).encode('utf-8')
+HTML_FOOTER = "</DL><p>".encode('utf-8')
+
+# Single-pass replacement table equivalent to html.escape(text, quote=True)
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+def load_tkinter():
+    """
+    Imports tkinter on demand, so headless (command line) runs never load Tk.
+    The modules are bound as globals for the GUI helpers below.
+    """
+    global tk, filedialog, messagebox, ttk
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
 
 
-class ProgressLoader:
+class ConversionError(Exception):
+    """
+    Raised when the Excel file cannot be converted. Carries a short title
+    (used for the GUI error dialog) alongside the message.
+    """
+
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+
+
+class ConsoleProgress:
+    """
+    Reports progress to the system terminal only. Used for headless runs and
+    as the base of the GUI ProgressLoader.
+    """
+
+    def update(self, message, percent_complete):
+        """
+        Prints the status message to the terminal.
+
+        Args:
+            message (str): The status message to display.
+            percent_complete (int): Integer between 0 and 100.
+        """
+        print(f"[Progress {percent_complete}%] {message}")
+
+    def close(self):
+        """Nothing to tear down for terminal output."""
+        pass
+
+
+class ProgressLoader(ConsoleProgress):
     """
     A helper class that manages a Toplevel popup window containing a progress bar
     and status text. It mirrors all status updates to the system terminal.
@@ -127,15 +210,17 @@ class ProgressLoader:
             percent_complete (int): Integer between 0 and 100.
         """
         # 1. Update Terminal
-        print(f"[Progress {percent_complete}%] {message}")
+        super().update(message, percent_complete)
 
         # 2. Update GUI
         self.lbl_status.config(text=message)
         self.progress_bar['value'] = percent_complete
-        self.window.update()
+        # Redraw only; a full update() would also process (and re-enter) pending events
+        self.window.update_idletasks()
 
     def close(self):
-        """Destroys the progress window."""
+        """Processes pending events once, then destroys the progress window."""
+        self.window.update()
         self.window.destroy()
 
 
@@ -152,16 +237,148 @@ def generate_timestamp():
 def escape_html(text):
     """
     Escapes HTML special characters to prevent broken markup.
+    Missing values are cleaned up upstream by clean_bookmark_data(), so the
+    input is always a string here.
     
     Args:
-        text (str/obj): The input text to escape.
+        text (str): The input text to escape.
     
     Returns:
-        str: Safe HTML string, or empty string if input is None/NaN.
+        str: Safe HTML string.
+    """
+    assert isinstance(text, str), f"escape_html expects str, got {type(text).__name__}"
+    return text.translate(HTML_ESCAPE_TABLE)
+
+
+def get_excel_engine(file_path):
+    """
+    Selects the pandas Excel reader engine for the given file.
+    Uses calamine for .xlsx files when installed (and pandas is 2.2+),
+    otherwise defers to the pandas default (openpyxl for .xlsx, xlrd for legacy .xls).
+
+    Args:
+        file_path (str): The path to the Excel file.
+
+    Returns:
+        str or None: The engine name, or None to let pandas decide.
+    """
+    _, extension = os.path.splitext(file_path)
+    if PANDAS_SUPPORTS_CALAMINE and extension.lower() == '.xlsx':
+        return 'calamine'
+    return None
+
+
+def detect_folder_columns(column_names):
+    """
+    Finds the folder level columns (FolderL1, FolderL2, ...) in a header row.
+
+    Args:
+        column_names (list): The column names of the sheet.
+
+    Returns:
+        list: Folder column names sorted by level index (L1, L2, L3...).
     """
-    if pd.isna(text) or text is None:
-        return ""
-    return html.escape(str(text))
+    folder_column_candidates = []
+    for col_name in column_names:
+        match = FOLDER_COLUMN_PATTERN.fullmatch(col_name)
+        if match:
+            folder_column_candidates.append((int(match.group(1)), col_name))
+
+    folder_column_candidates.sort(key=lambda x: x[0])
+    return [name for num, name in folder_column_candidates]
+
+
+def read_bookmark_columns(excel_file_path, rows_to_skip):
+    """
+    Reads only the Title, URL and folder columns of the first sheet.
+    The header row is scanned first so unrelated columns are never parsed,
+    and the needed columns are loaded directly as pandas string data.
+
+    Args:
+        excel_file_path (str): The path to the Excel file.
+        rows_to_skip (int): Number of rows above the header row.
+
+    Returns:
+        tuple: (pd.DataFrame, list of folder column names), or (None, [])
+               if the required Title/URL columns are missing.
+    """
+    with pd.ExcelFile(excel_file_path, engine=get_excel_engine(excel_file_path)) as workbook:
+        header_df = workbook.parse(skiprows=rows_to_skip, nrows=0)
+        column_names = header_df.columns.tolist()
+        if TITLE_COLUMN not in column_names or URL_COLUMN not in column_names:
+            return None, []
+
+        dynamic_folder_columns = detect_folder_columns(column_names)
+        needed_columns = [TITLE_COLUMN, URL_COLUMN, *dynamic_folder_columns]
+        df = workbook.parse(
+            skiprows=rows_to_skip,
+            usecols=needed_columns,
+            dtype={col_name: STRING_DTYPE for col_name in needed_columns}
+        )
+    return df, dynamic_folder_columns
+
+
+def read_bookmark_rows(excel_file_path, rows_to_skip):
+    """
+    Reads (title, url, folder_path) rows straight from the first sheet with
+    python-calamine, without building a pandas DataFrame. Cells are cleaned
+    the same way as clean_bookmark_data() (stripped strings, rows with
+    neither a title nor a URL dropped), and numbers and dates are rendered
+    as the pandas readers render them.
+
+    Args:
+        excel_file_path (str): The path to the Excel file.
+        rows_to_skip (int): Number of rows above the header row.
+
+    Returns:
+        tuple: (list of rows, list of folder column names), or (None, [])
+               if the required Title/URL columns are missing.
+    """
+    def cell_text(value):
+        # Calamine returns every number as float; print whole numbers as pandas does
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        # Date-only cells come back as date; pandas shows them as midnight timestamps
+        elif isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        return str(value).strip()
+
+    sheet = CalamineWorkbook.from_path(excel_file_path).get_sheet_by_index(0)
+    # Keep leading blank rows so rows_to_skip lines up with the sheet layout
+    sheet_rows = sheet.to_python(skip_empty_area=False)
+    if len(sheet_rows) <= rows_to_skip:
+        return None, []
+
+    # Map each header to its first occurrence; pandas renames later duplicates
+    # (e.g. 'FolderL1.1'), so they are ignored here as well
+    first_index = {}
+    for i, cell in enumerate(sheet_rows[rows_to_skip]):
+        first_index.setdefault(str(cell), i)
+    if TITLE_COLUMN not in first_index or URL_COLUMN not in first_index:
+        return None, []
+
+    dynamic_folder_columns = detect_folder_columns(list(first_index))
+    title_index = first_index[TITLE_COLUMN]
+    url_index = first_index[URL_COLUMN]
+    folder_indexes = [first_index[col_name] for col_name in dynamic_folder_columns]
+
+    bookmark_rows = []
+    for row in sheet_rows[rows_to_skip + 1:]:
+        title = cell_text(row[title_index])
+        url = cell_text(row[url_index])
+        if not title and not url:
+            continue
+
+        path = []
+        for folder_index in folder_indexes:
+            folder = cell_text(row[folder_index])
+            if not folder:
+                # Stop at the first empty folder column
+                break
+            path.append(folder)
+        bookmark_rows.append((title, url, path))
+
+    return bookmark_rows, dynamic_folder_columns
 
 
 def reveal_in_file_manager(file_path):
@@ -214,118 +431,139 @@ def center_window(window):
     window.geometry(f'+{x}+{y}')
 
 
-def generate_html_recursive(data_structure, indent_level=1):
-    """
-    Recursively traverses the bookmark tree structure to generate Netscape HTML.
+def clean_bookmark_data(df, title_col, url_col):
     """
-    html_output = []
-    indent = "    " * indent_level
-
-    # Process Bookmarks in current node
-    for bookmark in data_structure.get('_bookmarks_', []):
-        ts = generate_timestamp()
-        title = escape_html(bookmark.get('title'))
-        url = escape_html(bookmark.get('url'))
-        
-        if not title and not url:
-            continue
-        if not title:
-            title = "Untitled Bookmark"
-        if not url:
-            url = "#"
-            
-        html_output.append(
-            f'{indent}<DT><A HREF="{url}" ADD_DATE="{ts}" LAST_MODIFIED="{ts}">{title}</A>'
-        )
+    Normalizes the bookmark columns in one vectorized pass: every cell becomes
+    a stripped string and missing cells become empty strings. Rows with
+    neither a title nor a URL are dropped.
 
-    # Process Sub-folders in current node
-    for folder_name, sub_structure in data_structure.get('_folders_', {}).items():
-        ts = generate_timestamp()
-        escaped_folder_name = escape_html(folder_name)
-        if not escaped_folder_name:
-            escaped_folder_name = "Untitled Folder"
-            
-        html_output.append(
-            f'{indent}<DT><H3 ADD_DATE="{ts}" LAST_MODIFIED="{ts}" '
-            f'PERSONAL_TOOLBAR_FOLDER="false">{escaped_folder_name}</H3>'
-        )
-        html_output.append(f'{indent}<DL><p>')
-        html_output.append(generate_html_recursive(sub_structure, indent_level + 1))
-        
-        # --- FIX IS ON THE LINE BELOW ---
-        # WAS: html_output.append(f'{indent}<DL><p>') 
-        # NOW: Changed to </DL> to properly close the list
-        html_output.append(f'{indent}</DL><p>') 
+    Args:
+        df (pd.DataFrame): The DataFrame from read_bookmark_columns().
+        title_col (str): Column name for titles.
+        url_col (str): Column name for URLs.
 
-    return "\n".join(html_output)
+    Returns:
+        pd.DataFrame: The cleaned DataFrame.
+    """
+    df_cleaned = df.astype(STRING_DTYPE).apply(lambda col: col.str.strip()).fillna('')
+    has_content = (df_cleaned[title_col] != '') | (df_cleaned[url_col] != '')
+    return df_cleaned[has_content]
 
 
-def build_bookmark_tree(df, title_col, url_col, dynamic_folder_cols):
+def extract_bookmark_rows(df, title_col, url_col, dynamic_folder_cols):
     """
-    Converts a flat Pandas DataFrame into a nested dictionary structure.
+    Turns the cleaned DataFrame into (title, url, folder_path) rows.
 
     Args:
-        df (pd.DataFrame): The source DataFrame.
+        df (pd.DataFrame): The DataFrame returned by clean_bookmark_data().
         title_col (str): Column name for titles.
         url_col (str): Column name for URLs.
         dynamic_folder_cols (list): List of column names representing folder depth.
 
     Returns:
-        dict: A nested dictionary with keys '_bookmarks_' and '_folders_'.
+        iterable: (title, url, folder_path) tuples in sheet order.
     """
-    tree = {'_bookmarks_': [], '_folders_': {}}
+    # Plain Python lists: zipping them avoids per-row Series/ndarray indexing
+    titles = df[title_col].tolist()
+    urls = df[url_col].tolist()
+    folder_block = df[dynamic_folder_cols].to_numpy(dtype=object)
 
-    for _, row in df.iterrows():
-        current_level_node = tree
-        path_folders_for_row = []
+    # Each row's path stops at its first empty folder column. A trailing
+    # all-True sentinel column makes argmax return the full width for full rows.
+    is_empty = np.column_stack([folder_block == "", np.ones(len(folder_block), dtype=bool)])
+    path_lengths = is_empty.argmax(axis=1).tolist()
 
-        # Extract folder path for this specific row
-        for col_name in dynamic_folder_cols:
-            folder_name_in_cell = row.get(col_name)
-            if pd.notna(folder_name_in_cell) and str(folder_name_in_cell).strip() != "":
-                path_folders_for_row.append(str(folder_name_in_cell).strip())
-            else:
-                # Stop at the first empty folder column
-                break
-        
-        # Traverse/Create the tree structure based on path
-        for folder in path_folders_for_row:
-            if folder not in current_level_node['_folders_']:
-                current_level_node['_folders_'][folder] = {
-                    '_bookmarks_': [], 
-                    '_folders_': {}
-                }
-            current_level_node = current_level_node['_folders_'][folder]
-        
-        # Add the bookmark to the final node
-        bookmark_title_val = row.get(title_col)
-        bookmark_url_val = row.get(url_col)
-        has_title = pd.notna(bookmark_title_val) and str(bookmark_title_val).strip() != ""
-        has_url = pd.notna(bookmark_url_val) and str(bookmark_url_val).strip() != ""
-        
-        if has_title or has_url:
-            bm_data = {
-                'title': str(bookmark_title_val).strip() if has_title else "Untitled Bookmark",
-                'url': str(bookmark_url_val).strip() if has_url else "#"
-            }
-            current_level_node['_bookmarks_'].append(bm_data)
-            
-    return tree
+    folder_paths = [
+        row_folders[:path_length]
+        for row_folders, path_length in zip(folder_block.tolist(), path_lengths)
+    ]
+    return zip(titles, urls, folder_paths)
 
 
-def analyze_tree_stats(node, current_depth, stats_dict):
+def generate_bookmark_html(bookmark_rows, folder_depth, ts, stats_dict, html_output):
     """
-    Traverses the generated tree to collect statistics for the summary report.
+    Converts flat bookmark rows directly into Netscape HTML in one pass,
+    collecting the summary statistics along the way.
+
+    Rows are stably ordered by the first appearance of each folder on their
+    path, so every folder's rows become contiguous while keeping the original
+    Excel order (bookmarks before sub-folders, folders in first-seen order).
+    The rows are then streamed while tracking the currently open folder path:
+    folders that are left get closed and new ones get opened as the path
+    changes, so no intermediate tree is built.
 
     Args:
-        node (dict): The current tree node.
-        current_depth (int): The current depth level.
+        bookmark_rows (iterable): (title, url, folder_path) tuples of cleaned
+                                  strings, from extract_bookmark_rows() or
+                                  read_bookmark_rows().
+        folder_depth (int): Number of folder columns (maximum path length).
+        ts (int): Unix timestamp used for every ADD_DATE/LAST_MODIFIED attribute.
         stats_dict (dict): Accumulator dictionary for stats.
+        html_output (bytearray): Output buffer; the UTF-8 encoded HTML lines
+                                 (each ending in a newline) are appended to it.
     """
-    stats_dict['total_bookmarks'] += len(node.get('_bookmarks_', []))
-    for folder_name, sub_node in node.get('_folders_', {}).items():
-        stats_dict['folders_per_level'][current_depth].add(folder_name)
-        analyze_tree_stats(sub_node, current_depth + 1, stats_dict)
+    # 1. Compute each row's first-appearance sort key
+    folder_ranks = {}
+    rows = []
+    for title, url, path in bookmark_rows:
+        sort_key = []
+        parent_rank = -1
+        for folder in path:
+            parent_rank = folder_ranks.setdefault((parent_rank, folder), len(folder_ranks))
+            sort_key.append(parent_rank)
+        rows.append((sort_key, path, title, url))
+
+    # A shorter key sorts first, so a folder's own bookmarks precede its sub-folders
+    rows.sort(key=lambda row: row[0])
+
+    # 2. Stream rows, opening/closing folders as the path changes.
+    #    Each line is encoded straight into the caller's buffer.
+    ts_attrs = f'ADD_DATE="{ts}" LAST_MODIFIED="{ts}"'
+    # Per-depth constants: indentation strings and pre-encoded folder closing lines
+    indents = ["    " * (depth + 1) for depth in range(folder_depth + 1)]
+    close_lines = [f'{indent}</DL><p>\n'.encode('utf-8') for indent in indents]
+    folders_per_level = stats_dict['folders_per_level']
+    bookmark_count = 0
+    open_path = []
+
+    for _, path, title, url in rows:
+        common_depth = 0
+        while (common_depth < len(open_path) and common_depth < len(path)
+               and open_path[common_depth] == path[common_depth]):
+            common_depth += 1
+
+        # Close folders the path has left (deepest first)
+        for depth in range(len(open_path) - 1, common_depth - 1, -1):
+            html_output += close_lines[depth]
+
+        # Open the new folders on this path
+        for depth in range(common_depth, len(path)):
+            indent = indents[depth]
+            escaped_folder_name = escape_html(path[depth])
+            if not escaped_folder_name:
+                escaped_folder_name = "Untitled Folder"
+
+            html_output += (
+                f'{indent}<DT><H3 {ts_attrs} '
+                f'PERSONAL_TOOLBAR_FOLDER="false">{escaped_folder_name}</H3>\n'
+                f'{indent}<DL><p>\n'
+            ).encode('utf-8')
+            folders_per_level[depth] += 1
+        open_path = path
+
+        # Add the bookmark to the current folder
+        if not title and not url:
+            continue
+        indent = indents[len(path)]
+        title = escape_html(title) or "Untitled Bookmark"
+        url = escape_html(url) or "#"
+        html_output += f'{indent}<DT><A HREF="{url}" {ts_attrs}>{title}</A>\n'.encode('utf-8')
+        bookmark_count += 1
+
+    for depth in range(len(open_path) - 1, -1, -1):
+        html_output += close_lines[depth]
+
+    stats_dict['total_bookmarks'] += bookmark_count
 
 
 def get_summary_message(stats):
@@ -344,9 +582,9 @@ def get_summary_message(stats):
         lines.append("No folders were created.")
     else:
         lines.append("Folders created per level:")
-        for depth, folders_set in sorted(stats['folders_per_level'].items()):
+        for depth, folder_count in sorted(stats['folders_per_level'].items()):
             level_name = f"L{depth + 1}"
-            lines.append(f"  • {level_name}: {len(folders_set)} folder(s)")
+            lines.append(f"  • {level_name}: {folder_count} folder(s)")
     return "\n".join(lines)
 
 
@@ -474,11 +712,196 @@ def ask_for_output_html_file(default_filename, initial_dir, parent_root):
     return output_path
 
 
-def main():
+def build_default_output_filename(excel_file_path):
+    """
+    Builds the default output file name: the input file stem plus a timestamp.
+
+    Args:
+        excel_file_path (str): The path to the input Excel file.
+
+    Returns:
+        str: File name such as 'bookmarks_20250101_120000.html'.
+    """
+    input_basename = os.path.basename(excel_file_path)
+    input_filestem, _ = os.path.splitext(input_basename)
+    timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return f"{input_filestem}_{timestamp_str}.html"
+
+
+def convert_excel_to_html(excel_file_path, output_html_file, rows_to_skip, progress, no_pandas=False):
+    """
+    Runs the conversion pipeline: reads the Excel file, generates the HTML
+    and writes it to disk. Shared by the GUI and the headless command line.
+
+    Args:
+        excel_file_path (str): The path to the input Excel file.
+        output_html_file (str): The path of the HTML file to write.
+        rows_to_skip (int): Number of rows above the header row.
+        progress (ConsoleProgress): Receives the status updates.
+        no_pandas (bool): Read rows directly with python-calamine instead of
+                          building a pandas DataFrame.
+
+    Returns:
+        str: The formatted summary of the conversion.
+
+    Raises:
+        ConversionError: If the file cannot be read, lacks the required
+                         columns, or the output cannot be written.
+    """
+    # 1. Read Excel Data (only the columns the converter uses)
+    progress.update("Reading Excel data...", 10)
+    try:
+        if no_pandas:
+            sheet_data, dynamic_folder_columns = read_bookmark_rows(excel_file_path, rows_to_skip)
+        else:
+            sheet_data, dynamic_folder_columns = read_bookmark_columns(excel_file_path, rows_to_skip)
+    except Exception as e:
+        raise ConversionError("Excel Read Error", f"Error reading Excel file:\n{e}") from e
+
+    # 2. Validate Columns
+    progress.update("Validating columns...", 30)
+    if sheet_data is None:
+        msg = f"Error: Required columns '{TITLE_COLUMN}' or '{URL_COLUMN}' not found."
+        raise ConversionError("Column Error", msg)
+
+    # 3. Report Dynamic Folder Structure (detected from the header row)
+    progress.update(f"Detected {len(dynamic_folder_columns)} folder level(s)...", 40)
+
+    # 4. Clean Data
+    progress.update("Cleaning data...", 50)
+    if no_pandas:
+        # Rows were already cleaned while reading the sheet
+        bookmark_rows = sheet_data
+    else:
+        df_cleaned = clean_bookmark_data(sheet_data, TITLE_COLUMN, URL_COLUMN)
+        bookmark_rows = extract_bookmark_rows(
+            df_cleaned,
+            TITLE_COLUMN,
+            URL_COLUMN,
+            dynamic_folder_columns
+        )
+
+    # 5. Generate HTML Content (and statistics) in a single pass
+    progress.update("Generating HTML...", 70)
+    import_stats = {
+        'total_bookmarks': 0, 
+        'folders_per_level': collections.defaultdict(int)
+    }
+    run_timestamp = generate_timestamp()
+    html_output = bytearray(HTML_HEADER)
+    generate_bookmark_html(
+        bookmark_rows,
+        len(dynamic_folder_columns),
+        run_timestamp,
+        import_stats,
+        html_output
+    )
+    html_output += HTML_FOOTER
+
+    # 6. Save (with the platform's line endings, as a text-mode write would use)
+    progress.update("Saving file...", 95)
+    if os.linesep != '\n':
+        html_output = html_output.replace(b'\n', os.linesep.encode('utf-8'))
+    try:
+        with open(output_html_file, 'wb', buffering=1 << 20) as f:
+            f.write(html_output)
+    except Exception as e:
+        raise ConversionError("File Write Error", f"Error writing file:\n{e}") from e
+
+    return get_summary_message(import_stats)
+
+
+def parse_arguments():
+    """
+    Parses the command line options.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert an Excel sheet into a Netscape HTML bookmark file. "
+                    "Without --input, the interactive GUI is started."
+    )
+    parser.add_argument(
+        '--input',
+        help="input Excel file; runs headless (no GUI) when given"
+    )
+    parser.add_argument(
+        '--output',
+        help="output HTML file (default: <input name>_<timestamp>.html next to the input)"
+    )
+    parser.add_argument(
+        '--header-row',
+        type=int,
+        choices=[1, 2],
+        help="row holding the column headers; requires --input (default: 1)"
+    )
+    parser.add_argument(
+        '--no-pandas',
+        action='store_true',
+        help="read the sheet directly with python-calamine, skipping pandas (fastest on large files)"
+    )
+    args = parser.parse_args()
+    if args.output and not args.input:
+        parser.error("--output requires --input")
+    if args.header_row is not None and not args.input:
+        parser.error("--header-row requires --input (the GUI asks for it)")
+    if args.header_row is None:
+        args.header_row = 1
+    if args.no_pandas and not CALAMINE_AVAILABLE:
+        parser.error("--no-pandas requires python-calamine (pip install python-calamine)")
+    return args
+
+
+def run_headless(excel_file_path, output_html_file, rows_to_skip, no_pandas=False):
+    """
+    Converts a file without any GUI, reporting progress to the terminal.
+
+    Args:
+        excel_file_path (str): The path to the input Excel file.
+        output_html_file (str or None): Output path, or None for the default.
+        rows_to_skip (int): Number of rows above the header row.
+        no_pandas (bool): Read rows directly with python-calamine.
+
+    Returns:
+        int: Process exit code (0 on success).
+    """
+    if not output_html_file:
+        output_html_file = os.path.join(
+            os.path.dirname(excel_file_path),
+            build_default_output_filename(excel_file_path)
+        )
+    print(f"Input: {excel_file_path}")
+    print(f"Output: {output_html_file}")
+
+    progress = ConsoleProgress()
+    try:
+        summary_message_str = convert_excel_to_html(
+            excel_file_path,
+            output_html_file,
+            rows_to_skip,
+            progress,
+            no_pandas
+        )
+    except ConversionError as e:
+        print(f"{e.title}: {e.message}", file=sys.stderr)
+        return 1
+
+    progress.update("Done!", 100)
+    print(summary_message_str)
+    return 0
+
+
+def main(no_pandas=False):
     """
     Main application entry point. Orchestrates the GUI setup, data processing,
     and file generation.
+
+    Args:
+        no_pandas (bool): Read rows directly with python-calamine instead of
+                          building a pandas DataFrame.
     """
+    load_tkinter()
     root = None
     try:
         # Initialize Hidden Root for Tkinter
@@ -499,100 +922,31 @@ def main():
         excel_file_path = ask_for_excel_file(root)
         
         # Prepare output paths
-        input_basename = os.path.basename(excel_file_path)
-        input_filestem, _ = os.path.splitext(input_basename)
-        timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S')
-        default_output_filename = f"{input_filestem}_{timestamp_str}.html"
+        default_output_filename = build_default_output_filename(excel_file_path)
         initial_save_dir = os.path.dirname(excel_file_path)
         output_html_file = ask_for_output_html_file(default_output_filename, initial_save_dir, root)
 
         # 2. Start Progress Loader
         progress = ProgressLoader(root, title="NetscapeGen")
         
-        # 3. Read Excel Data
-        progress.update("Reading Excel data...", 10)
-        try:
-            time.sleep(0.5) # UI Refresh buffer
-            df = pd.read_excel(excel_file_path, skiprows=rows_to_skip)
-        except Exception as e:
-            progress.close()
-            messagebox.showerror("Excel Read Error", f"Error reading Excel file:\n{e}", parent=root)
-            return
-
-        # 4. Validate Columns
-        progress.update("Validating columns...", 30)
-        if TITLE_COLUMN not in df.columns or URL_COLUMN not in df.columns:
-            progress.close()
-            msg = f"Error: Required columns '{TITLE_COLUMN}' or '{URL_COLUMN}' not found."
-            messagebox.showerror("Column Error", msg, parent=root)
-            return
-
-        # 5. Detect Dynamic Folder Structure
-        progress.update("Analyzing structure...", 40)
-        folder_column_candidates = [] 
-        for col_name in df.columns.tolist():
-            match = re.fullmatch(r'FolderL(\d+)', col_name) 
-            if match:
-                folder_column_candidates.append((int(match.group(1)), col_name))
-        
-        # Sort columns by level index (L1, L2, L3...)
-        folder_column_candidates.sort(key=lambda x: x[0])
-        dynamic_folder_columns = [name for num, name in folder_column_candidates]
-
-        # 6. Clean Data
-        progress.update("Cleaning data...", 50)
-        not_nan_title = df[TITLE_COLUMN].notna() & (df[TITLE_COLUMN].astype(str).str.strip() != '')
-        not_nan_url = df[URL_COLUMN].notna() & (df[URL_COLUMN].astype(str).str.strip() != '')
-        df_cleaned = df[not_nan_title | not_nan_url].copy()
-
-        # Sanitize folder columns (fill NaNs with empty strings)
-        for col_name in dynamic_folder_columns:
-            if col_name in df_cleaned.columns: 
-                df_cleaned[col_name] = df_cleaned[col_name].fillna('').astype(str)
-
-        # 7. Build Hierarchical Tree
-        progress.update("Building bookmark tree...", 70)
-        bookmark_tree = build_bookmark_tree(
-            df_cleaned, 
-            TITLE_COLUMN, 
-            URL_COLUMN, 
-            dynamic_folder_columns
-        )
-        
-        # 8. Generate HTML Content
-        progress.update("Generating HTML...", 85)
-        html_header = (
-            "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
-            "<META HTTP-EQUIV=\"Content-Type\" CONTENT=\"text/html; charset=UTF-8\">\n"
-            "<TITLE>Bookmarks</TITLE>\n"
-            "<H1>Bookmarks</H1>\n"
-            "<DL><p>\n"
-        )
-        html_content = generate_html_recursive(bookmark_tree)
-        html_footer = "</DL><p>"
-        full_html = html_header + html_content + "\n" + html_footer
-
-        # 9. Save and Reveal
-        progress.update("Saving file...", 95)
+        # 3. Convert (read, clean, generate and save)
         try:
-            with open(output_html_file, 'w', encoding='utf-8') as f:
-                f.write(full_html)
-            reveal_in_file_manager(output_html_file)
-        except Exception as e:
+            summary_message_str = convert_excel_to_html(
+                excel_file_path,
+                output_html_file,
+                rows_to_skip,
+                progress,
+                no_pandas
+            )
+        except ConversionError as e:
             progress.close()
-            messagebox.showerror("File Write Error", f"Error writing file:\n{e}", parent=root)
+            messagebox.showerror(e.title, e.message, parent=root)
             return
 
-        # 10. Finalize
-        import_stats = {
-            'total_bookmarks': 0, 
-            'folders_per_level': collections.defaultdict(set)
-        }
-        analyze_tree_stats(bookmark_tree, 0, import_stats) 
-        summary_message_str = get_summary_message(import_stats)
+        # 4. Reveal and Finalize
+        reveal_in_file_manager(output_html_file)
         
         progress.update("Done!", 100)
-        time.sleep(0.5) 
         progress.close()
         
         show_summary_window(summary_message_str, output_html_file, root)
@@ -605,5 +959,16 @@ if __name__ == "__main__":
     print("=" * 40)
     print("NetscapeGen")
     print("=" * 40)
-    main()
-    print("\n--- Script finished. ---")
\ No newline at end of file
+    cli_args = parse_arguments()
+    exit_code = 0
+    if cli_args.input:
+        exit_code = run_headless(
+            cli_args.input,
+            cli_args.output,
+            cli_args.header_row - 1,
+            cli_args.no_pandas
+        )
+    else:
+        main(no_pandas=cli_args.no_pandas)
+    print("\n--- Script finished. ---")
+    sys.exit(exit_code)